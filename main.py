@@ -1,25 +1,159 @@
 import tweepy
+import bisect
+import math
 import os
 import requests
 import time
 import json
 import re
-from datetime import datetime, timedelta
-from textblob import TextBlob
+import sqlite3
+import threading
+from pathlib import Path
+from urllib.parse import urlparse
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
 from dotenv import load_dotenv
+from prometheus_client import Counter, Gauge, start_http_server
 import logging
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# DEBUG=1 raises only this module's verbosity; tweepy's own debug output
+# includes request headers, i.e. the bearer token, so it stays at INFO
+if os.getenv('DEBUG') == '1':
+    logger.setLevel(logging.DEBUG)
+
+_UTC = timezone.utc
+
+# Operational metrics, exported over HTTP when METRICS_PORT is set
+SEARCH_CALLS = Counter('rugguard_search_calls_total', 'Recent-search API calls made')
+REPLIES_POSTED = Counter('rugguard_replies_posted_total', 'Report replies posted successfully')
+REPLY_FAILURES = Counter('rugguard_reply_failures_total', 'Report replies that failed to post')
+DEDUPED = Counter('rugguard_deduped_tweets_total', 'Trigger tweets skipped because they were already processed')
+ANALYSIS_CACHE_HITS = Counter('rugguard_analysis_cache_hits_total', 'Account analyses served from cache')
+ANALYSIS_CACHE_MISSES = Counter('rugguard_analysis_cache_misses_total', 'Account analyses computed')
+RATE_LIMITED = Counter('rugguard_rate_limited_total', 'API responses with status 429', ['endpoint'])
+RATE_LIMIT_REMAINING = Gauge('rugguard_rate_limit_remaining', 'Requests left in the current rate-limit window', ['endpoint'])
+TRUST_LIST_SIZE = Gauge('rugguard_trust_list_size', 'Number of trusted accounts loaded')
+
+# Scoring bins for generate_trustworthiness_report: bisect_right(bins, value)
+# indexes a (points, positive factor, risk factor) row. nextafter makes an
+# upper bound inclusive, e.g. ages up to and including 90 days share a bin.
+_AGE_BINS = (30, math.nextafter(90, math.inf), math.nextafter(365, math.inf))
+_AGE_TABLE = (
+    (0, None, "Very new account"),
+    (0, None, None),
+    (1, "Mature account", None),
+    (2, "Established account", None),
+)
+_RATIO_BINS = (0.01, 0.1, math.nextafter(10, math.inf), math.nextafter(100, math.inf), math.inf)
+_RATIO_TABLE = (
+    (0, None, "Following many, few followers"),
+    (0, None, None),
+    (1, "Balanced follow ratio", None),
+    (0, None, None),
+    (0, "High follower ratio", None),
+    (1, "Many followers, following few", None),
+)
+_TRUST_NETWORK_BINS = (2, 5)
+_TRUST_NETWORK_TABLE = (
+    (0, None, "No verified trust connections"),
+    (2, "Trusted connections", None),
+    (3, "Verified trusted account", None),
+)
+
+# Reply layout, filled in one pass by generate_trustworthiness_report
+_REPORT_TEMPLATE = "🔍 @{u}\n{a} ({s:.1f}/7)\n📅 {d}d old | 👥 {f:,}F/{g:,}F{pos}{risk}"
+
+# Local copy of the GitHub trust list, revalidated with If-None-Match
+TRUST_CACHE_PATH = Path.home() / '.cache' / 'trustweet' / 'trustlist.json'
+
+class TokenBucket:
+    """Thread-safe token bucket that blocks callers until a request slot is free"""
+    def __init__(self, rate, capacity):
+        self.rate = rate  # tokens per second
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+    
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+    
+    def acquire(self):
+        """Take one token, sleeping until one is available"""
+        while True:
+            with self.lock:
+                self._refill()
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+    
+    def sync(self, remaining, reset_at):
+        """Align with the server's x-rate-limit-remaining / x-rate-limit-reset"""
+        with self.lock:
+            self._refill()
+            if remaining <= 0:
+                # Hold callers until the window resets instead of drawing a 429
+                self.tokens = -self.rate * max(0, reset_at - time.time())
+            else:
+                self.tokens = min(self.tokens, remaining)
+
 class RugGuardBot:
+    # Max concurrent reply POSTs when a search returns several triggers
+    reply_workers = 4
+    
+    # Polling bounds for run_continuous (seconds)
+    min_check_interval = 60
+    max_check_interval = 1800
+    check_interval_step = 30
+    
+    # Forget processed tweets once they fall out of the recent-search window
+    seen_ttl_seconds = 7 * 24 * 60 * 60
+    
+    # Endpoint paths mapped to rate-limit buckets (rate per second, capacity per 15-min window)
+    rate_limits = {
+        ('GET', '/2/tweets/search/recent'): ('search', 180 / 900, 180),
+        ('POST', '/2/tweets'): ('post', 200 / 900, 200),
+        ('GET', '/2/users/me'): ('me', 75 / 900, 75),
+    }
+    
+    # Recurring targets reuse their analysis for this long (seconds)
+    analysis_cache_ttl = 15 * 60
+    analysis_cache_size = 4096
+    
+    # Bio patterns, compiled once instead of on every analysis
+    _CRYPTO_KW = frozenset({'crypto', 'bitcoin', 'eth', 'nft', 'defi', 'web3', 'blockchain', 'token', 'coin', 'solana'})
+    _CRYPTO_RE = re.compile('|'.join(map(re.escape, sorted(_CRYPTO_KW))))
+    _LINK_RE = re.compile(r'https?://\S+')
+    
+    # Fields requested on both search and stream so analysis needs no extra lookups
+    tweet_fields = ['author_id', 'created_at', 'text', 'in_reply_to_user_id', 'referenced_tweets', 'conversation_id']
+    expansions = ['author_id', 'referenced_tweets.id', 'referenced_tweets.id.author_id', 'in_reply_to_user_id']
+    user_fields = ['username', 'created_at', 'description', 'verified', 'public_metrics']
+    
     def __init__(self):
         load_dotenv()
+        self._analysis_cache = {}
         self.setup_client()
         self.trigger_phrase = "riddle me this"
-        self.processed_tweets = set()
-        self.trusted_accounts = self.load_trusted_accounts()
+        self.trigger_query = f'"{self.trigger_phrase}" -is:retweet'  # Exclude retweets
+        self.seen_db = self.open_seen_store()
+        
+        # Auth check and trust list download are independent network calls;
+        # run them together so startup waits for the slower one only
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            trusted_future = executor.submit(self.load_trusted_accounts)
+            auth_future = executor.submit(self.verify_credentials)
+            self.trusted_accounts = trusted_future.result()
+            TRUST_LIST_SIZE.set(len(self.trusted_accounts))
+            auth_future.result()
         
     def setup_client(self):
         """Initialize Twitter API client"""
@@ -35,6 +169,7 @@ class RugGuardBot:
         if not all([api_key, api_secret, access_token, access_token_secret]):
             raise ValueError("All OAuth 1.0a credentials (API_KEY, API_SECRET, ACCESS_TOKEN, ACCESS_TOKEN_SECRET) are required for posting replies")
         
+        self.bearer_token = bearer_token
         self.client = tweepy.Client(
             bearer_token=bearer_token,
             consumer_key=api_key,
@@ -44,8 +179,17 @@ class RugGuardBot:
             wait_on_rate_limit=True
         )
         
-        # Test authentication
+        # Pace calls locally so bursts wait for a slot rather than tripping a 429
+        self._buckets = {
+            name: TokenBucket(rate=rate, capacity=capacity)
+            for name, rate, capacity in self.rate_limits.values()
+        }
+        self.client.session.hooks['response'].append(self.sync_rate_limit)
+    
+    def verify_credentials(self):
+        """Test authentication against the API"""
         try:
+            self._buckets['me'].acquire()
             me = self.client.get_me()
             logger.info(f"✅ Authenticated as: @{me.data.username}")
         except Exception as e:
@@ -53,100 +197,194 @@ class RugGuardBot:
             logger.error("Make sure all 5 credentials are set correctly")
             raise
     
+    def sync_rate_limit(self, response, *args, **kwargs):
+        """Session response hook that resyncs a bucket from rate-limit headers"""
+        if response.status_code in (401, 429):
+            # Data behind cached analyses may be stale or unauthorized; start fresh
+            self._analysis_cache.clear()
+        
+        key = (response.request.method, urlparse(response.url).path)
+        limit = self.rate_limits.get(key)
+        if not limit:
+            return
+        
+        if response.status_code == 429:
+            RATE_LIMITED.labels(endpoint=limit[0]).inc()
+        remaining = response.headers.get('x-rate-limit-remaining')
+        reset_at = response.headers.get('x-rate-limit-reset')
+        if remaining is not None and reset_at is not None:
+            RATE_LIMIT_REMAINING.labels(endpoint=limit[0]).set(int(remaining))
+            self._buckets[limit[0]].sync(int(remaining), int(reset_at))
+    
+    def open_seen_store(self):
+        """Open the sqlite store of processed tweet IDs so restarts don't re-reply"""
+        db_path = os.getenv('SEEN_DB_PATH', 'seen.db')
+        conn = sqlite3.connect(db_path)
+        conn.execute("CREATE TABLE IF NOT EXISTS seen (id INTEGER PRIMARY KEY, seen_at REAL NOT NULL)")
+        conn.commit()
+        return conn
+    
+    def is_processed(self, tweet_id):
+        """Check whether a tweet was already handled"""
+        row = self.seen_db.execute("SELECT 1 FROM seen WHERE id = ?", (int(tweet_id),)).fetchone()
+        return row is not None
+    
+    def mark_processed(self, tweet_id):
+        """Record a tweet as handled"""
+        self.seen_db.execute(
+            "INSERT OR REPLACE INTO seen (id, seen_at) VALUES (?, ?)",
+            (int(tweet_id), time.time())
+        )
+        self.seen_db.commit()
+    
+    def _gc(self):
+        """Evict processed tweet IDs older than the recent-search window"""
+        cutoff = time.time() - self.seen_ttl_seconds
+        removed = self.seen_db.execute("DELETE FROM seen WHERE seen_at < ?", (cutoff,)).rowcount
+        self.seen_db.commit()
+        if removed:
+            logger.info(f"🧹 Evicted {removed} expired processed tweet IDs")
+    
     def load_trusted_accounts(self):
-        """Load trusted accounts list from GitHub"""
+        """Load trusted accounts list from GitHub, revalidating a local copy with its ETag"""
+        cached = self.read_trust_cache()
+        headers = {}
+        if cached.get('etag'):
+            headers['If-None-Match'] = cached['etag']
+        
         try:
             url = "https://raw.githubusercontent.com/devsyrem/turst-list/main/list"
-            response = requests.get(url, timeout=10)
-            response.raise_for_status()
-            
-            trusted_list = []
-            for line in response.text.strip().split('\n'):
-                line = line.strip()
-                if line and not line.startswith('#'):
-                    username = line.replace('@', '').strip().lower()
-                    if username:
-                        trusted_list.append(username)
+            with requests.get(url, headers=headers, timeout=10, stream=True) as response:
+                if response.status_code == 304:
+                    logger.info(f"✅ Trusted accounts unchanged, using {len(cached['list'])} cached accounts")
+                    return frozenset(cached['list'])
+                
+                response.raise_for_status()
+                response.encoding = response.encoding or 'utf-8'
+                
+                # Parse line by line as the body arrives instead of buffering .text
+                usernames = (
+                    line.replace('@', '').strip().lower()
+                    for line in response.iter_lines(decode_unicode=True)
+                    if not line.strip().startswith('#')
+                )
+                trusted = frozenset(username for username in usernames if username)
+                etag = response.headers.get('ETag')
             
-            logger.info(f"✅ Loaded {len(trusted_list)} trusted accounts")
-            return set(trusted_list)  # Use set for faster lookups
+            self.write_trust_cache(etag, sorted(trusted))
+            logger.info(f"✅ Loaded {len(trusted)} trusted accounts")
+            return trusted
             
         except requests.RequestException as e:
             logger.error(f"❌ Failed to load trusted accounts: {e}")
-            return set()
+            if cached.get('list'):
+                logger.info(f"ℹ️ Falling back to {len(cached['list'])} cached trusted accounts")
+                return frozenset(cached['list'])
+            return frozenset()
+    
+    def read_trust_cache(self):
+        """Read the cached trust list and its ETag, empty dict if missing or unreadable"""
+        try:
+            with open(TRUST_CACHE_PATH, encoding='utf-8') as f:
+                cached = json.load(f)
+            if isinstance(cached.get('list'), list):
+                return cached
+        except (OSError, ValueError, AttributeError):
+            pass
+        return {}
+    
+    def write_trust_cache(self, etag, trusted_list):
+        """Store the trust list with its ETag for conditional requests on next startup"""
+        try:
+            TRUST_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+            with open(TRUST_CACHE_PATH, 'w', encoding='utf-8') as f:
+                json.dump({'etag': etag, 'list': trusted_list}, f)
+        except OSError as e:
+            logger.warning(f"⚠️ Could not write trust list cache: {e}")
     
     def search_and_analyze_single_trigger(self):
         """OPTIMIZED: Single API call to find and analyze trigger mentions"""
         try:
             # Single comprehensive API call with all needed expansions
+            self._buckets['search'].acquire()
+            SEARCH_CALLS.inc()
             tweets = self.client.search_recent_tweets(
-                query=f'"{self.trigger_phrase}" -is:retweet',  # Exclude retweets
+                query=self.trigger_query,
                 max_results=10,  # Get multiple to find valid ones
-                tweet_fields=['author_id', 'created_at', 'text', 'in_reply_to_user_id', 'referenced_tweets', 'conversation_id'],
-                expansions=['author_id', 'referenced_tweets.id', 'referenced_tweets.id.author_id', 'in_reply_to_user_id'],
-                user_fields=['username', 'created_at', 'description', 'verified', 'public_metrics']
+                tweet_fields=self.tweet_fields,
+                expansions=self.expansions,
+                user_fields=self.user_fields
             )
             
             if not tweets.data:
                 logger.info("No tweets found with trigger phrase")
                 return None
+            logger.debug(f"Search returned {len(tweets.data)} tweets")
             
-            # Build user lookup from includes
-            users_dict = {}
-            if hasattr(tweets, 'includes') and tweets.includes and 'users' in tweets.includes:
-                for user in tweets.includes['users']:
-                    users_dict[user.id] = user
-            
-            # Find valid trigger replies and process
-            for tweet in tweets.data:
-                if (tweet.id in self.processed_tweets or 
-                    not tweet.referenced_tweets or 
-                    self.trigger_phrase.lower() not in tweet.text.lower()):
-                    continue
-                
-                # Find the original tweet being replied to
-                original_tweet_id = None
-                original_author_id = None
-                
-                for ref_tweet in tweet.referenced_tweets:
-                    if ref_tweet.type == 'replied_to':
-                        original_tweet_id = ref_tweet.id
-                        # Get author from referenced tweets in includes
-                        if hasattr(tweets, 'includes') and tweets.includes and 'tweets' in tweets.includes:
-                            for included_tweet in tweets.includes['tweets']:
-                                if included_tweet.id == ref_tweet.id:
-                                    original_author_id = included_tweet.author_id
-                                    break
-                        break
-                
-                if not original_author_id or original_author_id not in users_dict:
-                    continue
-                
-                # Mark as processed
-                self.processed_tweets.add(tweet.id)
-                
-                # Analyze using data we already have
-                original_author = users_dict[original_author_id]
-                analysis = self.analyze_account_from_data(original_author)
-                
-                # Generate and post report
-                report = self.generate_trustworthiness_report(analysis)
-                success = self.post_reply(tweet.id, report)
-                
-                if success:
-                    logger.info(f"✅ Successfully processed trigger for @{original_author.username}")
-                    return True
-                else:
-                    logger.warning(f"❌ Failed to post reply for @{original_author.username}")
+            pending_replies = self.collect_trigger_replies(tweets.data, tweets.includes)
+            if not pending_replies:
+                return None
             
-            return None
+            # Post all reports concurrently - replies are network-bound
+            return self.post_replies(pending_replies) or None
             
         except Exception as e:
             logger.error(f"Error in search_and_analyze_single_trigger: {e}")
             return None
     
+    def collect_trigger_replies(self, tweet_list, includes):
+        """Analyze trigger tweets and return (tweet_id, username, report) tuples to post"""
+        # Index includes by ID once so each reference resolves in O(1)
+        includes = includes or {}
+        users_dict = {user.id: user for user in includes.get('users', [])}
+        tweets_by_id = {included.id: included for included in includes.get('tweets', [])}
+        
+        # Find valid trigger replies and build their reports
+        pending_replies = []
+        for tweet in tweet_list:
+            if self.is_processed(tweet.id):
+                DEDUPED.inc()
+                continue
+            if (not tweet.referenced_tweets or 
+                self.trigger_phrase.lower() not in tweet.text.lower()):
+                continue
+            
+            # Find the original tweet being replied to
+            original_tweet_id = None
+            original_author_id = None
+            
+            for ref_tweet in tweet.referenced_tweets:
+                if ref_tweet.type == 'replied_to':
+                    original_tweet_id = ref_tweet.id
+                    # Get author from referenced tweets in includes
+                    original_tweet = tweets_by_id.get(ref_tweet.id)
+                    if original_tweet:
+                        original_author_id = original_tweet.author_id
+                    break
+            
+            if not original_author_id or original_author_id not in users_dict:
+                logger.debug(f"Skipping tweet {tweet.id}: original author not in includes")
+                continue
+            
+            # Mark as processed
+            self.mark_processed(tweet.id)
+            
+            # Analyze using data we already have
+            original_author = users_dict[original_author_id]
+            analysis = self.analyze_account_from_data(original_author)
+            report = self.generate_trustworthiness_report(analysis)
+            pending_replies.append((tweet.id, original_author.username, report))
+        
+        return pending_replies
+    
     def analyze_account_from_data(self, user_data):
-        """Analyze account using data already fetched"""
+        """Analyze account using data already fetched, reusing recent results per user"""
+        cached = self._analysis_cache.get(user_data.id)
+        if cached and cached[0] > time.monotonic():
+            ANALYSIS_CACHE_HITS.inc()
+            return cached[1]
+        ANALYSIS_CACHE_MISSES.inc()
+        
         try:
             # Extract metrics from public_metrics
             public_metrics = getattr(user_data, 'public_metrics', {})
@@ -162,20 +400,25 @@ class RugGuardBot:
                 'is_verified': getattr(user_data, 'verified', False),
                 'tweet_count': tweet_count,
                 'followers_count': followers_count,
-                'following_count': following_count,
-                'engagement_metrics': {'avg_likes': 0, 'avg_retweets': 0, 'avg_replies': 0, 'engagement_rate': 0},
-                'content_sentiment': {'sentiment': 'neutral', 'polarity': 0, 'subjectivity': 0}
+                'following_count': following_count
             }
             
             # Simplified trust network check
             analysis['trust_network_score'] = self.check_trust_network_simple(user_data.username)
             
+            self.cache_analysis(user_data.id, analysis)
             return analysis
             
         except Exception as e:
             logger.error(f"Error analyzing account data: {e}")
             return None
     
+    def cache_analysis(self, user_id, analysis):
+        """Store an analysis for analysis_cache_ttl seconds, evicting the oldest entry when full"""
+        if user_id not in self._analysis_cache and len(self._analysis_cache) >= self.analysis_cache_size:
+            self._analysis_cache.pop(next(iter(self._analysis_cache)))
+        self._analysis_cache[user_id] = (time.monotonic() + self.analysis_cache_ttl, analysis)
+    
     def calculate_account_age(self, created_at):
         """Calculate account age in days"""
         try:
@@ -189,11 +432,11 @@ class RugGuardBot:
             else:
                 created_dt = created_at
             
-            # Make timezone-aware if needed
+            # X timestamps are UTC; treat naive values the same way
             if created_dt.tzinfo is None:
-                created_dt = created_dt.replace(tzinfo=datetime.now().astimezone().tzinfo)
+                created_dt = created_dt.replace(tzinfo=_UTC)
             
-            return (datetime.now(created_dt.tzinfo) - created_dt).days
+            return (datetime.now(_UTC) - created_dt).days
         except Exception as e:
             logger.error(f"Error calculating account age: {e}")
             return 0
@@ -211,13 +454,10 @@ class RugGuardBot:
         if not bio:
             return {'length': 0, 'has_crypto_keywords': False, 'has_links': False}
         
-        crypto_keywords = ['crypto', 'bitcoin', 'eth', 'nft', 'defi', 'web3', 'blockchain', 'token', 'coin', 'solana']
-        link_pattern = r'http[s]?://[^\s]+'
-        
         return {
             'length': len(bio),
-            'has_crypto_keywords': any(keyword in bio.lower() for keyword in crypto_keywords),
-            'has_links': bool(re.search(link_pattern, bio))
+            'has_crypto_keywords': bool(self._CRYPTO_RE.search(bio.lower())),
+            'has_links': bool(self._LINK_RE.search(bio))
         }
     
     def check_trust_network_simple(self, username):
@@ -240,40 +480,20 @@ class RugGuardBot:
         risk_factors = []
         positive_factors = []
         
-        # Account age scoring
+        # Age, follow ratio and trust network each map to one scoring bin
         age_days = analysis['account_age_days']
-        if age_days > 365:
-            trust_score += 2
-            positive_factors.append("Established account")
-        elif age_days > 90:
-            trust_score += 1
-            positive_factors.append("Mature account")
-        elif age_days < 30:
-            risk_factors.append("Very new account")
-        
-        # Follower ratio scoring
-        ratio = analysis['follower_following_ratio']
-        if ratio == float('inf'):
-            trust_score += 1
-            positive_factors.append("Many followers, following few")
-        elif 0.1 <= ratio <= 10:
-            trust_score += 1
-            positive_factors.append("Balanced follow ratio")
-        elif ratio > 100:
-            positive_factors.append("High follower ratio")
-        elif ratio < 0.01:
-            risk_factors.append("Following many, few followers")
-        
-        # Trust network scoring
-        trust_network = analysis['trust_network_score']
-        if trust_network >= 5:
-            trust_score += 3
-            positive_factors.append("Verified trusted account")
-        elif trust_network >= 2:
-            trust_score += 2
-            positive_factors.append("Trusted connections")
-        else:
-            risk_factors.append("No verified trust connections")
+        scored_dimensions = (
+            (_AGE_BINS, _AGE_TABLE, age_days),
+            (_RATIO_BINS, _RATIO_TABLE, analysis['follower_following_ratio']),
+            (_TRUST_NETWORK_BINS, _TRUST_NETWORK_TABLE, analysis['trust_network_score']),
+        )
+        for bins, table, value in scored_dimensions:
+            points, positive, risk = table[bisect.bisect_right(bins, value)]
+            trust_score += points
+            if positive:
+                positive_factors.append(positive)
+            if risk:
+                risk_factors.append(risk)
         
         # Verification bonus
         if analysis['is_verified']:
@@ -301,23 +521,19 @@ class RugGuardBot:
             assessment = "🔴 HIGH RISK"
         
         # Build concise report (Twitter character limit friendly)
-        report_lines = [
-            f"🔍 @{username}",
-            f"{assessment} ({trust_score:.1f}/7)",
-            f"📅 {age_days}d old | 👥 {analysis['followers_count']:,}F/{analysis['following_count']:,}F"
-        ]
-        
-        if positive_factors:
-            report_lines.append("✅ " + ", ".join(positive_factors[:2]))
+        pos = ("\n✅ " + ", ".join(positive_factors[:2])) if positive_factors else ""
+        risk = ("\n⚠️ " + ", ".join(risk_factors[:2])) if risk_factors else ""
         
-        if risk_factors:
-            report_lines.append("⚠️ " + ", ".join(risk_factors[:2]))
-        
-        return "\n".join(report_lines)
+        return _REPORT_TEMPLATE.format(
+            u=username, a=assessment, s=trust_score, d=age_days,
+            f=analysis['followers_count'], g=analysis['following_count'],
+            pos=pos, risk=risk
+        )
     
     def post_reply(self, reply_to_tweet_id, report):
         """Post the trustworthiness report as a reply"""
         try:
+            self._buckets['post'].acquire()
             response = self.client.create_tweet(
                 text=report,
                 in_reply_to_tweet_id=reply_to_tweet_id
@@ -334,29 +550,56 @@ class RugGuardBot:
             logger.error(f"❌ Error posting reply: {e}")
             return False
     
+    def post_replies(self, pending_replies):
+        """Post several reports concurrently, returns True if any reply succeeded"""
+        workers = min(self.reply_workers, len(pending_replies))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(
+                lambda item: self.post_reply(item[0], item[2]),
+                pending_replies
+            ))
+        
+        for (_, username, _), success in zip(pending_replies, results):
+            if success:
+                REPLIES_POSTED.inc()
+                logger.info(f"✅ Successfully processed trigger for @{username}")
+            else:
+                REPLY_FAILURES.inc()
+                logger.warning(f"❌ Failed to post reply for @{username}")
+        
+        return any(results)
+    
     def run_once(self):
         """Run one cycle of the bot - OPTIMIZED for minimal API calls"""
         logger.info("🔄 Running optimized bot cycle...")
         
         try:
+            self._gc()
             result = self.search_and_analyze_single_trigger()
             if result:
                 logger.info("✅ Successfully processed a trigger")
             else:
                 logger.info("ℹ️ No valid triggers found or processed")
+            return result
                 
         except Exception as e:
             logger.error(f"❌ Error in bot cycle: {e}")
+            return None
     
     def run_continuous(self, check_interval=600):
-        """Run the bot continuously with longer intervals to preserve API limits"""
-        logger.info(f"🚀 Starting RugGuard Bot (checking every {check_interval} seconds)")
+        """Run the bot continuously, adapting the interval to how often triggers appear"""
+        logger.info(f"🚀 Starting RugGuard Bot (adaptive interval, starting at {check_interval} seconds)")
+        interval = check_interval
         
         while True:
             try:
-                self.run_once()
-                logger.info(f"💤 Sleeping for {check_interval} seconds...")
-                time.sleep(check_interval)
+                # AIMD: halve the wait after a hit, back off additively while idle
+                if self.run_once():
+                    interval = max(self.min_check_interval, interval // 2)
+                else:
+                    interval = min(self.max_check_interval, interval + self.check_interval_step)
+                logger.info(f"💤 Sleeping for {interval} seconds...")
+                time.sleep(interval)
                 
             except KeyboardInterrupt:
                 logger.info("🛑 Bot stopped by user")
@@ -366,18 +609,78 @@ class RugGuardBot:
                 logger.info("🔄 Retrying in 5 minutes...")
                 time.sleep(300)
 
+    def run_stream(self):
+        """Receive trigger tweets from the filtered stream instead of polling search"""
+        logger.info("🚀 Starting RugGuard Bot (filtered stream)")
+        self._gc()
+        stream = TriggerStream(self, self.bearer_token, wait_on_rate_limit=True)
+        stream.sync_rules(self.trigger_query)
+        
+        try:
+            stream.filter(
+                tweet_fields=self.tweet_fields,
+                expansions=self.expansions,
+                user_fields=self.user_fields
+            )
+        except KeyboardInterrupt:
+            logger.info("🛑 Bot stopped by user")
+            stream.disconnect()
+
+class TriggerStream(tweepy.StreamingClient):
+    """Filtered stream client that hands each matching tweet to the bot"""
+    def __init__(self, bot, bearer_token, **kwargs):
+        super().__init__(bearer_token, **kwargs)
+        self.bot = bot
+    
+    def sync_rules(self, query):
+        """Make the trigger query the only active stream rule"""
+        existing = self.get_rules().data or []
+        stale_ids = [rule.id for rule in existing if rule.value != query]
+        if stale_ids:
+            self.delete_rules(stale_ids)
+        
+        if not any(rule.value == query for rule in existing):
+            self.add_rules(tweepy.StreamRule(query))
+        logger.info(f"✅ Stream rule active: {query}")
+    
+    def on_response(self, response):
+        """Analyze and reply to a pushed tweet using its expanded includes"""
+        if not response.data:
+            return
+        
+        try:
+            pending_replies = self.bot.collect_trigger_replies([response.data], response.includes)
+            if pending_replies:
+                self.bot.post_replies(pending_replies)
+        except Exception as e:
+            logger.error(f"Error handling streamed tweet: {e}")
+    
+    def on_errors(self, errors):
+        logger.error(f"❌ Stream returned errors: {errors}")
+    
+    def on_request_error(self, status_code):
+        logger.error(f"❌ Stream request failed with status {status_code}")
+
 def main():
     """Main function to run the bot"""
     try:
+        metrics_port = os.getenv('METRICS_PORT')
+        if metrics_port:
+            start_http_server(int(metrics_port))
+            logger.info(f"📈 Serving metrics on port {metrics_port}")
+        
         bot = RugGuardBot()
         
         # Check environment variable for run mode
         if os.getenv('RUN_ONCE', '').lower() == 'true':
             logger.info("🔧 Running in single-cycle mode")
             bot.run_once()
+        elif os.getenv('RUN_STREAM', '').lower() == 'true':
+            logger.info("📡 Running in stream mode")
+            bot.run_stream()
         else:
             logger.info("🔄 Running in continuous mode")
-            # Increased interval to preserve API limits (10 minutes)
+            # Starting interval; run_continuous adapts it to trigger activity
             bot.run_continuous(check_interval=600)
             
     except Exception as e: